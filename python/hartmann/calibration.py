@@ -9,6 +9,7 @@
 from __future__ import annotations
 
 import pathlib
+import re
 import warnings
 
 import matplotlib.pyplot as plt
@@ -90,17 +91,31 @@ def calibrate(
             if not spectro_path.exists():
                 raise FileExistsError("Path to images does not exist.")
 
-        for expno in range(exposure_0, exposure_1 + 1):
-            files += list(spectro_path.glob(f"sdR-*-{expno:08d}.fit*"))
+        # List the directory once instead of globbing it for each exposure.
+        expnos = set(range(exposure_0, exposure_1 + 1))
+        for path in spectro_path.iterdir():
+            match = re.match(r"sdR-.*-([0-9]{8})\.fit", path.name)
+            if match and int(match.group(1)) in expnos:
+                files.append(path)
 
     output = pathlib.Path(output or pathlib.Path(".").parent)
 
     if isinstance(cameras, str):
         cameras = [cameras]
 
-    processed: list[str] = []
+    processed: set[str] = set()
     raw_data = []
 
+    # Consecutive pairs share a file, so keep the headers we have already read.
+    headers: dict[str, fits.Header] = {}
+
+    def get_header(path: pathlib.Path) -> fits.Header:
+        if str(path) not in headers:
+            headers[str(path)] = fits.getheader(str(path))
+        return headers[str(path)]
+
+    regions = regions or [None]
+
     with Progress(
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
@@ -112,6 +127,9 @@ def calibrate(
 
             task = progress.add_task(camera, total=len(camera_files))
 
+            # Built on the first valid pair and reused for the rest of the camera.
+            hc: HartmannCamera | None = None
+
             for ifile in range(len(camera_files) - 1):
                 file1 = pathlib.Path(camera_files[ifile])
                 file2 = pathlib.Path(camera_files[ifile + 1])
@@ -131,8 +149,8 @@ def calibrate(
                 if str(file1) in processed:
                     continue
 
-                header_1 = fits.getheader(str(file1))
-                header_2 = fits.getheader(str(file2))
+                header_1 = get_header(file1)
+                header_2 = get_header(file2)
 
                 expno_1 = header_1.get("EXPOSURE", -999)
                 expno_2 = header_2.get("EXPOSURE", -999)
@@ -158,9 +176,8 @@ def calibrate(
                     warnings.warn(f"{str(file1)}: collimator positions do not match.")
                     continue
 
-                hc = HartmannCamera(observatory, camera, m=1, b=0)
-
-                regions = regions or [None]
+                if hc is None:
+                    hc = HartmannCamera(observatory, camera, m=1, b=0)
 
                 for ii, region in enumerate(regions):
                     try:
@@ -184,8 +201,7 @@ def calibrate(
                         )
                     )
 
-                processed.append(str(file1))
-                processed.append(str(file2))
+                processed.update((str(file1), str(file2)))
 
                 progress.update(task, advance=2)
 
@@ -14,10 +14,8 @@ import multiprocessing
 import os
 import pathlib
 from dataclasses import dataclass, field
-from functools import partial
-from glob import glob
 
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 
 import numpy
 import numpy.typing
@@ -52,12 +50,32 @@ def _shift_product(data1, data2, shift, order=3, mask=None, prefilter=False):
 
     """
 
-    if mask is None:
-        mask = numpy.ones(data1.shape)
-
     shifted = scipy.ndimage.shift(data2, [shift, 0], order=order, prefilter=prefilter)
 
-    return (data1 * shifted * mask).sum()
+    product = data1 * shifted
+    if mask is not None:
+        product *= mask
+
+    return product.sum()
+
+
+# Images shared with the workers of the shift pool. Set by _init_shift_worker.
+_worker_data: tuple[numpy.ndarray, numpy.ndarray] | None = None
+
+
+def _init_shift_worker(data1: numpy.ndarray, data2: numpy.ndarray):
+    """Stores the images in a pool worker so they are not sent with each task."""
+
+    global _worker_data
+    _worker_data = (data1, data2)
+
+
+def _worker_shift_product(shift: float):
+    """Calls `._shift_product` with the images stored in the worker."""
+
+    assert _worker_data is not None
+
+    return _shift_product(*_worker_data, shift)
 
 
 @dataclass
@@ -144,10 +162,30 @@ class HartmannCamera:
         self.focustol = focustol or constants["focustol"]
         self.maxshift = constants["maxshift"]
 
+        # Data slice, bias slice, and gain for quadrants 1 through 4. These do
+        # not change between images so we build them only once.
+        regions = self.config["regions"]
+        self._quadrants = [
+            (
+                nslice(*regions["data"][qq]),
+                nslice(*regions["bias"][qq]),
+                self.config["gain"][self.camera][qq - 1],
+            )
+            for qq in range(1, 5)
+        ]
+
         self.command = command
 
     def reset(self, **kwargs):
-        """Resets the parameters."""
+        """Resets the parameters.
+
+        Unless passed as keyword arguments, the configuration and command
+        the object was created with are reused.
+
+        """
+
+        kwargs.setdefault("config", self.config)
+        kwargs.setdefault("command", self.command)
 
         self.__init__(self.observatory, self.camera, **kwargs)
 
@@ -196,17 +234,20 @@ class HartmannCamera:
         camera_result = CameraResult(self.camera, bsteps=self.bsteps)
 
         try:
-            proc1, side1 = self.prepare_image(
-                str(image1),
-                no_check_image=no_check_image,
-            )
-            proc2, side2 = self.prepare_image(
-                str(image2),
-                no_check_image=no_check_image,
-            )
+            # Each file is opened once and the same HDU is used for the header
+            # and the data. Both headers are validated before reading any pixel
+            # data so that a bad pair fails without decompressing the images.
+            with self._open(str(image1)) as hdul1, self._open(str(image2)) as hdul2:
+                side1 = self._get_side(hdul1[0].header, str(image1), no_check_image)
+                side2 = self._get_side(hdul2[0].header, str(image2), no_check_image)
+
+                if side1 == side2:
+                    raise HartmannError(
+                        f"Both images were taken with the {side1} door."
+                    )
 
-            if side1 == side2:
-                raise HartmannError(f"Both images were taken with the {side1} door.")
+                proc1 = self._process_data(hdul1[0].data)
+                proc2 = self._process_data(hdul2[0].data)
 
             ishifts, coeffs, best, offset = self.calculate_shift(
                 proc1,
@@ -263,10 +304,25 @@ class HartmannCamera:
 
         """
 
+        with self._open(image) as hdul:
+            side = self._get_side(hdul[0].header, image, no_check_image)
+            return self._process_data(hdul[0].data), side
+
+    def _open(self, image: str) -> fits.HDUList:
+        """Opens an image. HDUs and data are only read when accessed."""
+
         if not os.path.exists(image):
             raise HartmannError(f"The file {image} does not exist.")
 
-        header: fits.Header = fits.getheader(image)
+        return fits.open(image)
+
+    def _get_side(
+        self,
+        header: fits.Header,
+        image: str,
+        no_check_image: bool = False,
+    ) -> str:
+        """Checks a header and returns the Hartmann side of the image."""
 
         if no_check_image is False and self._check_header(header):
             raise HartmannError(f"Failed verifying image {image}.")
@@ -286,33 +342,37 @@ class HartmannCamera:
         else:
             raise HartmannError(f"Cannot determine Hartmann side for image {image}.")
 
-        # Get image data
-        data = cast(numpy.ndarray, fits.getdata(image)).astype(numpy.float32)
+        return side
+
+    def _process_data(self, raw: numpy.ndarray) -> numpy.ndarray:
+        """Applies bias and gain to the raw image data and reconstructs the frame."""
 
         # Raw data regions for quadrants 1 through 4. Apply gain and reconstruct.
         # Quadrants are 1 to 4
         #   [ 3  4 ]
         #   [ 1  2 ]
+        # The processed quadrants are written directly into a single output
+        # array, and only the data and bias regions are converted to float32.
 
-        proc_quads: list[numpy.ndarray] = []
-
-        for qq in range(1, 5):
-            q_slice = nslice(*self.config["regions"]["data"][qq])
-            q_raw = data[q_slice]
+        q1_rows, q1_cols = raw[self._quadrants[0][0]].shape
+        q3_rows, q3_cols = raw[self._quadrants[2][0]].shape
+        q2_cols = raw[self._quadrants[1][0]].shape[1]
 
-            gain = self.config["gain"][self.camera][qq - 1]
+        proc = numpy.empty((q1_rows + q3_rows, q1_cols + q2_cols), numpy.float32)
+        proc_quads = [
+            proc[:q1_rows, :q1_cols],
+            proc[:q1_rows, q1_cols:],
+            proc[q1_rows:, :q3_cols],
+            proc[q1_rows:, q3_cols:],
+        ]
 
-            bias_slice = nslice(*self.config["regions"]["bias"][qq])
-            q_bias = numpy.median(data[bias_slice])
+        for (q_slice, bias_slice, gain), q_proc in zip(self._quadrants, proc_quads):
+            q_bias = numpy.median(raw[bias_slice].astype(numpy.float32))
 
-            q_proc = gain * (q_raw - q_bias)
-            proc_quads.append(q_proc)
+            numpy.subtract(raw[q_slice], q_bias, out=q_proc, dtype=numpy.float32)
+            q_proc *= gain
 
-        bottom = numpy.hstack((proc_quads[0], proc_quads[1]))
-        top = numpy.hstack((proc_quads[2], proc_quads[3]))
-        proc = numpy.vstack((bottom, top))
-
-        return proc, side
+        return proc
 
     def _check_header(self, header: fits.Header):
         """Checks a header. Returns `True` if the image should not be used."""
@@ -430,8 +490,9 @@ class HartmannCamera:
         else:
             analysis_slice = nslice(*self.config["regions"]["analysis"][self.camera])
 
-        analysis1 = data1.copy()[analysis_slice]
-        analysis2 = data2.copy()[analysis_slice]
+        # Views into the processed frames; neither is modified below.
+        analysis1 = data1[analysis_slice]
+        analysis2 = data2[analysis_slice]
 
         # First we check if there's actually light on the images.
         # The core of the idea here is to find the variance of a region with
@@ -439,10 +500,8 @@ class HartmannCamera:
         # We clip all values > 1000 to 1000 before we compute the variance,
         # to reduce the impact of a handful of bright pixels.
 
-        check1 = analysis1.copy()
-        check2 = analysis2.copy()
-        check1[check1 > 1000] = 1000
-        check2[check2 > 1000] = 1000
+        check1 = numpy.minimum(analysis1, 1000)
+        check2 = numpy.minimum(analysis2, 1000)
 
         # ddof=1 for consistency with IDL's variance() which has denominator (N-1)
         var1 = float(numpy.var(check1, ddof=1))
@@ -470,11 +529,16 @@ class HartmannCamera:
         filtered1 = scipy.ndimage.spline_filter(analysis1, order=3)
         filtered2 = scipy.ndimage.spline_filter(analysis2, order=3)
 
+        # The mask does not depend on the shift, so apply it to the first image
+        # once instead of for each shift.
+        weighted1 = filtered1 * mask
+
         # Apply the shift filter and calculate the product of the shifted images
-        # for each shift value in ishift.
-        with multiprocessing.Pool(4) as pool:
-            func = partial(_shift_product, filtered1, filtered2, mask=mask)
-            coeffs = pool.map(func, ishifts)
+        # for each shift value in ishift. The images are sent to each worker once
+        # when the pool starts instead of being pickled with every chunk of shifts.
+        init_args = (weighted1, filtered2)
+        with multiprocessing.Pool(4, _init_shift_worker, init_args) as pool:
+            coeffs = pool.map(_worker_shift_product, ishifts)
 
         best = numpy.argmax(coeffs)
         offset: float = ishifts[best]
@@ -647,8 +711,15 @@ class Hartmann:
             # NOTE: exposureId is a lagging indicator.
             exposure_id += 1
 
-            SJD = get_sjd(OBSERVATORY)
-            filenames += list(glob(f"/data/spectro/{SJD}/*{exposure_id}*"))
+            # Scan the night directory once and keep the files for this exposure.
+            spectro_dir = f"/data/spectro/{get_sjd(OBSERVATORY)}"
+            if os.path.isdir(spectro_dir):
+                with os.scandir(spectro_dir) as entries:
+                    filenames += [
+                        entry.path
+                        for entry in entries
+                        if str(exposure_id) in entry.name
+                    ]
 
             self.command.info(text=f"Got hartmann {side} exposure {exposure_id}")
 
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import copy
 import pathlib
 
 import pytest
@@ -19,14 +20,21 @@ from sdsstools import read_yaml_file
 from hartmann.actor import HartmannActor
 
 
-@pytest.fixture()
-async def config():
-    """Yields the test configuration file."""
+@pytest.fixture(scope="session")
+def _config():
+    """Parses the test configuration file once per session."""
 
     path = pathlib.Path(__file__).parent / "data/test_hartmann.yml"
     yield read_yaml_file(str(path))
 
 
+@pytest.fixture()
+async def config(_config):
+    """Yields a copy of the test configuration that tests can safely modify."""
+
+    yield copy.deepcopy(_config)
+
+
 @pytest_asyncio.fixture
 async def actor(config):
     actor_ = HartmannActor.from_config(config, observatory="APO")
@@ -6,7 +6,9 @@
 # @Filename: download_data.py
 # @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
 
+import gzip
 import os
+import shutil
 import urllib.request
 
 
@@ -33,6 +35,16 @@ def download_data():
             print(f"Downloading {url} to {dest_file} ...")
             urllib.request.urlretrieve(url, dest_file)
 
+        # Keep an uncompressed copy so that the tests do not need to inflate
+        # the same frames over and over.
+        if dest_file.endswith(".gz"):
+            uncompressed_file = dest_file[:-3]
+            if not os.path.exists(uncompressed_file):
+                print(f"Decompressing {dest_file} ...")
+                with gzip.open(dest_file, "rb") as src:
+                    with open(uncompressed_file, "wb") as dst:
+                        shutil.copyfileobj(src, dst)
+
 
 if __name__ == "__main__":
     download_data()
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import functools
 import pathlib
 
 import pytest
@@ -18,19 +19,28 @@ from hartmann import CameraResult, Hartmann, HartmannCamera, HartmannResult, log
 from hartmann.exceptions import HartmannError
 
 
-def get_image(image_no: int, camera: str = "b1", precooked: bool = False):
-    data = pathlib.Path(__file__).parent / "data"
+DATA_DIR = pathlib.Path(__file__).parent.resolve() / "data"
+
 
+@functools.cache
+def get_image(image_no: int, camera: str = "b1", precooked: bool = False):
     if precooked:
-        data = data / "precooked"
+        data = DATA_DIR / "precooked"
     else:
-        data = data / "downloaded"
+        data = DATA_DIR / "downloaded"
 
-    filename = f"sdR-{camera}-{image_no:08}.fit.gz"
+    filename = f"sdR-{camera}-{image_no:08}.fit"
 
+    # Prefer the uncompressed copy written by download_data.py, if present.
     path = data / filename
+    if not path.exists():
+        path = data / f"{filename}.gz"
 
     if not path.exists():
+        # Downloaded frames are not part of the repository. Skip instead of
+        # failing if tests/download_data.py has not been run.
+        if not precooked:
+            pytest.skip(f"File {path!s} not found. Run tests/download_data.py.")
         raise FileExistsError(f"File {path!s} does not exist.")
 
     return path
@@ -84,6 +94,7 @@ def test_hartmann_camera_reset(config):
     assert hc.observatory == "APO"
     assert hc.camera == "b1"
     assert hc.m is not None
+    assert hc.config is config
 
 
 def test_hartmann_camera_same_side_fails(config):
@@ -141,10 +152,19 @@ def test_hartmann_camera_both_left(config):
 
     hc = HartmannCamera("APO", "r2", config=config)
 
-    with pytest.raises(HartmannError):
+    # The precooked frames only contain headers, so this only passes if the
+    # sides are checked before the pixel data is read.
+    with pytest.raises(HartmannError, match="Both images were taken"):
         hc(img1, img2)
 
 
+def test_hartmann_camera_missing_file(config):
+    hc = HartmannCamera("APO", "r2", config=config)
+
+    with pytest.raises(HartmannError, match="does not exist"):
+        hc("sdR-r2-00000001.fit.gz", "sdR-r2-00000002.fit.gz")
+
+
 def test_hartmann_camera_command(caplog, config):
     command = FakeCommand(log)
 